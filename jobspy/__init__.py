@@ -12,7 +12,7 @@ from jobspy.google import Google
 from jobspy.indeed import Indeed
 from jobspy.linkedin import LinkedIn
 from jobspy.naukri import Naukri
-from jobspy.model import JobType, Location, JobResponse, Country
+from jobspy.model import JobType, JobResponse, Country
 from jobspy.model import SalarySource, ScraperInput, Site
 from jobspy.util import (
     set_logger_level,
@@ -26,7 +26,28 @@ from jobspy.util import (
 from jobspy.ziprecruiter import ZipRecruiter
 
 
-# Update the SCRAPER_MAPPING dictionary in the scrape_jobs function
+SCRAPER_MAPPING = {
+    Site.LINKEDIN: LinkedIn,
+    Site.INDEED: Indeed,
+    Site.ZIP_RECRUITER: ZipRecruiter,
+    Site.GLASSDOOR: Glassdoor,
+    Site.GOOGLE: Google,
+    Site.BAYT: BaytScraper,
+    Site.NAUKRI: Naukri,
+    Site.BDJOBS: BDJobs,  # Add BDJobs to the scraper mapping
+}
+
+SITE_LOGGER_NAMES = {
+    Site.LINKEDIN: "LinkedIn",
+    Site.INDEED: "Indeed",
+    Site.ZIP_RECRUITER: "ZipRecruiter",
+    Site.GLASSDOOR: "Glassdoor",
+    Site.GOOGLE: "Google",
+    Site.BAYT: "Bayt",
+    Site.NAUKRI: "Naukri",
+    Site.BDJOBS: "BDJobs",
+}
+
 
 def scrape_jobs(
     site_name: str | list[str] | Site | list[Site] | None = None,
@@ -55,16 +76,6 @@ def scrape_jobs(
     Scrapes job data from job boards concurrently
     :return: Pandas DataFrame containing job data
     """
-    SCRAPER_MAPPING = {
-        Site.LINKEDIN: LinkedIn,
-        Site.INDEED: Indeed,
-        Site.ZIP_RECRUITER: ZipRecruiter,
-        Site.GLASSDOOR: Glassdoor,
-        Site.GOOGLE: Google,
-        Site.BAYT: BaytScraper,
-        Site.NAUKRI: Naukri,
-        Site.BDJOBS: BDJobs,  # Add BDJobs to the scraper mapping
-    }
     set_logger_level(verbose)
     job_type = get_enum_from_value(job_type) if job_type else None
 
@@ -105,10 +116,7 @@ def scrape_jobs(
         scraper_class = SCRAPER_MAPPING[site]
         scraper = scraper_class(proxies=proxies, ca_cert=ca_cert, user_agent=user_agent)
         scraped_data: JobResponse = scraper.scrape(scraper_input)
-        cap_name = site.value.capitalize()
-        site_name = "ZipRecruiter" if cap_name == "Zip_recruiter" else cap_name
-        site_name = "LinkedIn" if cap_name == "Linkedin" else cap_name
-        create_logger(site_name).info(f"finished scraping")
+        create_logger(SITE_LOGGER_NAMES[site]).info(f"finished scraping")
         return site.value, scraped_data
 
     site_to_jobs_dict = {}
@@ -126,12 +134,11 @@ def scrape_jobs(
             site_value, scraped_data = future.result()
             site_to_jobs_dict[site_value] = scraped_data
 
-    jobs_dfs: list[pd.DataFrame] = []
+    jobs_rows: list[dict] = []
 
     for site, job_response in site_to_jobs_dict.items():
         for job in job_response.jobs:
-            job_data = job.dict()
-            job_url = job_data["job_url"]
+            job_data = job.model_dump()
             job_data["site"] = site
             job_data["company"] = job_data["company_name"]
             job_data["job_type"] = (
@@ -142,19 +149,14 @@ def scrape_jobs(
             job_data["emails"] = (
                 ", ".join(job_data["emails"]) if job_data["emails"] else None
             )
-            if job_data["location"]:
-                job_data["location"] = Location(
-                    **job_data["location"]
-                ).display_location()
+            if job.location:
+                job_data["location"] = job.location.display_location()
 
             # Handle compensation
             compensation_obj = job_data.get("compensation")
             if compensation_obj and isinstance(compensation_obj, dict):
-                job_data["interval"] = (
-                    compensation_obj.get("interval").value
-                    if compensation_obj.get("interval")
-                    else None
-                )
+                interval = compensation_obj.get("interval")
+                job_data["interval"] = interval.value if interval else None
                 job_data["min_amount"] = compensation_obj.get("min_amount")
                 job_data["max_amount"] = compensation_obj.get("max_amount")
                 job_data["currency"] = compensation_obj.get("currency", "USD")
@@ -189,31 +191,21 @@ def scrape_jobs(
             job_data["skills"] = (
                 ", ".join(job_data["skills"]) if job_data["skills"] else None
             )
-            job_data["experience_range"] = job_data.get("experience_range")
-            job_data["company_rating"] = job_data.get("company_rating")
-            job_data["company_reviews_count"] = job_data.get("company_reviews_count")
-            job_data["vacancy_count"] = job_data.get("vacancy_count")
-            job_data["work_from_home_type"] = job_data.get("work_from_home_type")
-
-            job_df = pd.DataFrame([job_data])
-            jobs_dfs.append(job_df)
-
-    if jobs_dfs:
-        # Step 1: Filter out all-NA columns from each DataFrame before concatenation
-        filtered_dfs = [df.dropna(axis=1, how="all") for df in jobs_dfs]
 
-        # Step 2: Concatenate the filtered DataFrames
-        jobs_df = pd.concat(filtered_dfs, ignore_index=True)
+            jobs_rows.append(job_data)
 
-        # Step 3: Ensure all desired columns are present, adding missing ones as empty
-        for column in desired_order:
-            if column not in jobs_df.columns:
-                jobs_df[column] = None  # Add missing columns as empty
+    if jobs_rows:
+        # Step 1: Build the DataFrame in the desired column order;
+        # columns missing from every row are added as empty
+        jobs_df = pd.DataFrame(jobs_rows, columns=desired_order)
 
-        # Reorder the DataFrame according to the desired order
-        jobs_df = jobs_df[desired_order]
+        # Step 2: Mark missing values as NaN, keeping columns that are empty
+        # in every row as None
+        empty_columns = jobs_df.columns[jobs_df.isna().all()]
+        jobs_df = jobs_df.where(jobs_df.notna())
+        jobs_df[empty_columns] = None
 
-        # Step 4: Sort the DataFrame as required
+        # Step 3: Sort the DataFrame as required
         return jobs_df.sort_values(
             by=["site", "date_posted"], ascending=[True, False]
         ).reset_index(drop=True)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import logging
 import random
 import time
 
@@ -49,9 +50,9 @@ class BaytScraper(Scraper):
             if not job_elements:
                 break
 
-            if job_elements:
+            if log.isEnabledFor(logging.DEBUG):
                 log.debug(
-                    "First job element snippet:\n" + job_elements[0].prettify()[:500]
+                    "First job element snippet:\n%s", job_elements[0].prettify()[:500]
                 )
 
             initial_count = len(job_list)
@@ -62,10 +63,10 @@ class BaytScraper(Scraper):
                         job_list.append(job_post)
                         if len(job_list) >= results_wanted:
                             break
-                    else:
+                    elif log.isEnabledFor(logging.DEBUG):
                         log.debug(
-                            "Extraction returned None. Job snippet:\n"
-                            + job.prettify()[:500]
+                            "Extraction returned None. Job snippet:\n%s",
+                            job.prettify()[:500],
                         )
                 except Exception as e:
                     log.error(f"Bayt: Error extracting job info: {str(e)}")
@@ -91,7 +92,7 @@ class BaytScraper(Scraper):
             response.raise_for_status()
             soup = BeautifulSoup(response.text, "html.parser")
             job_listings = soup.find_all("li", attrs={"data-js-job": ""})
-            log.debug(f"Found {len(job_listings)} job listing elements")
+            log.debug("Found %d job listing elements", len(job_listings))
             return job_listings
         except Exception as e:
             log.error(f"Bayt: Error fetching jobs - {str(e)}")
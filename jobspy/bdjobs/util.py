@@ -1,9 +1,13 @@
 #util.py
+import re
 from bs4 import BeautifulSoup
 from datetime import datetime
 from typing import Optional, List, Dict, Any
 
 from jobspy.model import Location, Country
+from jobspy.bdjobs.constant import date_formats, job_selectors
+
+remote_regex = re.compile(r"remote|work from home|wfh|home based", re.IGNORECASE)
 
 
 def parse_location(location_text: str, country: str = "bangladesh") -> Location:
@@ -35,8 +39,6 @@ def parse_date(date_text: str) -> Optional[datetime]:
     :param date_text: Date text from job listing
     :return: datetime object or None if parsing fails
     """
-    from .constant import date_formats
-    
     try:
         # Clean up date text
         if "Deadline:" in date_text:
@@ -60,8 +62,6 @@ def find_job_listings(soup: BeautifulSoup) -> List[Any]:
     :param soup: BeautifulSoup object
     :return: List of job card elements
     """
-    from .constant import job_selectors
-    
     # Try different selectors
     for selector in job_selectors:
         if "." in selector:
@@ -87,14 +87,12 @@ def is_job_remote(title: str, description: str = None, location: Location = None
     :param location: Job location
     :return: True if job is remote, False otherwise
     """
-    remote_keywords = ["remote", "work from home", "wfh", "home based"]
-    
     # Combine all text fields
-    full_text = title.lower()
+    full_text = title
     if description:
-        full_text += " " + description.lower()
+        full_text += " " + description
     if location:
-        full_text += " " + location.display_location().lower()
-    
+        full_text += " " + location.display_location()
+
     # Check for remote keywords
-    return any(keyword in full_text for keyword in remote_keywords)
\ No newline at end of file
+    return remote_regex.search(full_text) is not None
\ No newline at end of file
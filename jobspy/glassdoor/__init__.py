@@ -3,6 +3,7 @@ from __future__ import annotations
 import re
 import json
 import requests
+from requests.adapters import HTTPAdapter
 from typing import Tuple
 from datetime import datetime, timedelta
 from concurrent.futures import ThreadPoolExecutor, as_completed
@@ -45,6 +46,7 @@ class Glassdoor(Scraper):
         self.base_url = None
         self.country = None
         self.session = None
+        self.description_session = None
         self.scraper_input = None
         self.jobs_per_page = 30
         self.max_pages = 30
@@ -81,23 +83,34 @@ class Glassdoor(Scraper):
         range_start = 1 + (scraper_input.offset // self.jobs_per_page)
         tot_pages = (scraper_input.results_wanted // self.jobs_per_page) + 2
         range_end = min(tot_pages, self.max_pages + 1)
-        for page in range(range_start, range_end):
-            log.info(f"search page: {page} / {range_end - 1}")
-            try:
-                jobs, cursor = self._fetch_jobs_page(
-                    scraper_input, location_id, location_type, page, cursor
-                )
-                job_list.extend(jobs)
-                if not jobs or len(job_list) >= scraper_input.results_wanted:
-                    job_list = job_list[: scraper_input.results_wanted]
-                    break
-            except Exception as e:
-                log.error(f"Glassdoor: {str(e)}")
-                break
+        with requests.Session() as self.description_session:
+            self.description_session.mount(
+                "https://", HTTPAdapter(pool_maxsize=self.jobs_per_page)
+            )
+            with ThreadPoolExecutor(max_workers=self.jobs_per_page) as executor:
+                for page in range(range_start, range_end):
+                    log.info(f"search page: {page} / {range_end - 1}")
+                    try:
+                        jobs, cursor = self._fetch_jobs_page(
+                            executor,
+                            scraper_input,
+                            location_id,
+                            location_type,
+                            page,
+                            cursor,
+                        )
+                        job_list.extend(jobs)
+                        if not jobs or len(job_list) >= scraper_input.results_wanted:
+                            job_list = job_list[: scraper_input.results_wanted]
+                            break
+                    except Exception as e:
+                        log.error(f"Glassdoor: {str(e)}")
+                        break
         return JobResponse(jobs=job_list)
 
     def _fetch_jobs_page(
         self,
+        executor: ThreadPoolExecutor,
         scraper_input: ScraperInput,
         location_id: int,
         location_type: str,
@@ -133,17 +146,16 @@ class Glassdoor(Scraper):
 
         jobs_data = res_json["data"]["jobListings"]["jobListings"]
 
-        with ThreadPoolExecutor(max_workers=self.jobs_per_page) as executor:
-            future_to_job_data = {
-                executor.submit(self._process_job, job): job for job in jobs_data
-            }
-            for future in as_completed(future_to_job_data):
-                try:
-                    job_post = future.result()
-                    if job_post:
-                        jobs.append(job_post)
-                except Exception as exc:
-                    raise GlassdoorException(f"Glassdoor generated an exception: {exc}")
+        future_to_job_data = {
+            executor.submit(self._process_job, job): job for job in jobs_data
+        }
+        for future in as_completed(future_to_job_data):
+            try:
+                job_post = future.result()
+                if job_post:
+                    jobs.append(job_post)
+            except Exception as exc:
+                raise GlassdoorException(f"Glassdoor generated an exception: {exc}")
 
         return jobs, get_cursor_for_page(
             res_json["data"]["jobListings"]["paginationCursors"], page_num + 1
@@ -178,8 +190,11 @@ class Glassdoor(Scraper):
         location_type = job["header"].get("locationType", "")
         age_in_days = job["header"].get("ageInDays")
         is_remote, location = False, None
-        date_diff = (datetime.now() - timedelta(days=age_in_days)).date()
-        date_posted = date_diff if age_in_days is not None else None
+        date_posted = (
+            (datetime.now() - timedelta(days=age_in_days)).date()
+            if age_in_days is not None
+            else None
+        )
 
         if location_type == "S":
             is_remote = True
@@ -246,7 +261,7 @@ class Glassdoor(Scraper):
                 """,
             }
         ]
-        res = requests.post(url, json=body, headers=headers)
+        res = self.description_session.post(url, json=body, headers=headers)
         if res.status_code != 200:
             return None
         data = res.json()[0]
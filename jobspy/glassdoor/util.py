@@ -1,4 +1,10 @@
-from jobspy.model import Compensation, CompensationInterval, Location, JobType
+from jobspy.model import (
+    Compensation,
+    CompensationInterval,
+    Location,
+    JobType,
+    job_type_lookup,
+)
 
 
 def parse_compensation(data: dict) -> Compensation | None:
@@ -24,9 +30,9 @@ def parse_compensation(data: dict) -> Compensation | None:
 
 
 def get_job_type_enum(job_type_str: str) -> list[JobType] | None:
-    for job_type in JobType:
-        if job_type_str in job_type.value:
-            return [job_type]
+    job_type = job_type_lookup.get(job_type_str)
+    if job_type:
+        return [job_type]
 
 
 def parse_location(location_name: str) -> Location | None:
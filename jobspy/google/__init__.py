@@ -180,8 +180,9 @@ class Google(Scraper):
         days_ago_str = job_info[12]
         if type(days_ago_str) == str:
             match = re.search(r"\d+", days_ago_str)
-            days_ago = int(match.group()) if match else None
-            date_posted = (datetime.now() - timedelta(days=days_ago)).date()
+            if match:
+                days_ago = int(match.group())
+                date_posted = (datetime.now() - timedelta(days=days_ago)).date()
 
         description = job_info[19]
 
@@ -1,3 +1,4 @@
+import json
 import re
 
 from jobspy.util import create_logger
@@ -28,8 +29,6 @@ def find_job_info_initial_page(html_text: str):
     results = []
     matches = re.finditer(pattern, html_text)
 
-    import json
-
     for match in matches:
         try:
             parsed_data = json.loads(match.group(1))
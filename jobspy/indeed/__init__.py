@@ -57,7 +57,7 @@ class Indeed(Scraper):
         domain, self.api_country_code = self.scraper_input.country.indeed_domain_value
         self.base_url = f"https://{domain}.indeed.com"
         self.headers = api_headers.copy()
-        self.headers["indeed-co"] = self.scraper_input.country.indeed_domain_value
+        self.headers["indeed-co"] = self.api_country_code
         job_list = []
         page = 1
 
@@ -108,11 +108,9 @@ class Indeed(Scraper):
         payload = {
             "query": query,
         }
-        api_headers_temp = api_headers.copy()
-        api_headers_temp["indeed-co"] = self.api_country_code
         response = self.session.post(
             self.api_url,
-            headers=api_headers_temp,
+            headers=self.headers,
             json=payload,
             timeout=10,
             verify=False,
@@ -208,7 +206,7 @@ class Indeed(Scraper):
 
         job_type = get_job_type(job["attributes"])
         timestamp_seconds = job["datePublished"] / 1000
-        date_posted = datetime.fromtimestamp(timestamp_seconds).strftime("%Y-%m-%d")
+        date_posted = datetime.fromtimestamp(timestamp_seconds).date()
         employer = job["employer"].get("dossier") if job["employer"] else None
         employer_details = employer.get("employerDetails", {}) if employer else {}
         rel_url = job["employer"]["relativeCompanyPageUrl"] if job["employer"] else None
@@ -1,6 +1,10 @@
+import re
+
 from jobspy.model import CompensationInterval, JobType, Compensation
 from jobspy.util import get_enum_from_job_type
 
+remote_regex = re.compile(r"remote|work from home|wfh", re.IGNORECASE)
+
 
 def get_job_type(attributes: list) -> list[JobType]:
     """
@@ -53,29 +57,23 @@ def is_job_remote(job: dict, description: str) -> bool:
     """
     Searches the description, location, and attributes to check if job is remote
     """
-    remote_keywords = ["remote", "work from home", "wfh"]
-    is_remote_in_attributes = any(
-        any(keyword in attr["label"].lower() for keyword in remote_keywords)
-        for attr in job["attributes"]
-    )
-    is_remote_in_description = any(
-        keyword in description.lower() for keyword in remote_keywords
+    return (
+        any(remote_regex.search(attr["label"]) for attr in job["attributes"])
+        or remote_regex.search(description) is not None
+        or remote_regex.search(job["location"]["formatted"]["long"]) is not None
     )
-    is_remote_in_location = any(
-        keyword in job["location"]["formatted"]["long"].lower()
-        for keyword in remote_keywords
-    )
-    return is_remote_in_attributes or is_remote_in_description or is_remote_in_location
+
+
+interval_mapping = {
+    "DAY": "DAILY",
+    "YEAR": "YEARLY",
+    "HOUR": "HOURLY",
+    "WEEK": "WEEKLY",
+    "MONTH": "MONTHLY",
+}
 
 
 def get_compensation_interval(interval: str) -> CompensationInterval:
-    interval_mapping = {
-        "DAY": "DAILY",
-        "YEAR": "YEARLY",
-        "HOUR": "HOURLY",
-        "WEEK": "WEEKLY",
-        "MONTH": "MONTHLY",
-    }
     mapped_interval = interval_mapping.get(interval.upper(), None)
     if mapped_interval and mapped_interval in CompensationInterval.__members__:
         return CompensationInterval[mapped_interval]
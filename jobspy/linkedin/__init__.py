@@ -3,7 +3,7 @@ from __future__ import annotations
 import math
 import random
 import time
-from datetime import datetime
+from datetime import date
 from typing import Optional
 from urllib.parse import urlparse, urlunparse, unquote
 
@@ -213,7 +213,7 @@ class LinkedIn(Scraper):
         if datetime_tag and "datetime" in datetime_tag.attrs:
             datetime_str = datetime_tag["datetime"]
             try:
-                date_posted = datetime.strptime(datetime_str, "%Y-%m-%d")
+                date_posted = date.fromisoformat(datetime_str)
             except:
                 date_posted = None
         job_details = {}
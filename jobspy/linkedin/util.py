@@ -1,17 +1,24 @@
+import re
+
 from bs4 import BeautifulSoup
 
 from jobspy.model import JobType, Location
 from jobspy.util import get_enum_from_job_type
 
+remote_regex = re.compile(r"remote|work from home|wfh", re.IGNORECASE)
+
+
+job_type_codes = {
+    JobType.FULL_TIME: "F",
+    JobType.PART_TIME: "P",
+    JobType.INTERNSHIP: "I",
+    JobType.CONTRACT: "C",
+    JobType.TEMPORARY: "T",
+}
+
 
 def job_type_code(job_type_enum: JobType) -> str:
-    return {
-        JobType.FULL_TIME: "F",
-        JobType.PART_TIME: "P",
-        JobType.INTERNSHIP: "I",
-        JobType.CONTRACT: "C",
-        JobType.TEMPORARY: "T",
-    }.get(job_type_enum, "")
+    return job_type_codes.get(job_type_enum, "")
 
 
 def parse_job_type(soup_job_type: BeautifulSoup) -> list[JobType] | None:
@@ -89,8 +96,6 @@ def is_job_remote(title: dict, description: str, location: Location) -> bool:
     """
     Searches the title, location, and description to check if job is remote
     """
-    remote_keywords = ["remote", "work from home", "wfh"]
     location = location.display_location()
-    full_string = f'{title} {description} {location}'.lower()
-    is_remote = any(keyword in full_string for keyword in remote_keywords)
-    return is_remote
+    full_string = f"{title} {description} {location}"
+    return remote_regex.search(full_string) is not None
@@ -57,6 +57,9 @@ class JobType(Enum):
     VOLUNTEER = ("volunteer",)
 
 
+job_type_lookup = {value: job_type for job_type in JobType for value in job_type.value}
+
+
 class Country(Enum):
     """
     Gets the subdomain for Indeed and Glassdoor.
@@ -168,16 +171,20 @@ class Country(Enum):
     def from_string(cls, country_str: str):
         """Convert a string to the corresponding Country enum."""
         country_str = country_str.strip().lower()
-        for country in cls:
-            country_names = country.value[0].split(",")
-            if country_str in country_names:
-                return country
+        country = country_lookup.get(country_str)
+        if country:
+            return country
         valid_countries = [country.value for country in cls]
         raise ValueError(
             f"Invalid country string: '{country_str}'. Valid countries are: {', '.join([country[0] for country in valid_countries])}"
         )
 
 
+country_lookup = {
+    name: country for country in Country for name in country.value[0].split(",")
+}
+
+
 class Location(BaseModel):
     country: Country | str | None = None
     city: Optional[str] = None
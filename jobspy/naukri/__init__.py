@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import logging
 import math
 import random
 import time
@@ -127,14 +128,14 @@ class Naukri(Scraper):
                 if not job_id or job_id in seen_ids:
                     continue
                 seen_ids.add(job_id)
-                log.debug(f"Processing job ID: {job_id}")
+                log.debug("Processing job ID: %s", job_id)
 
                 try:
                     fetch_desc = scraper_input.linkedin_fetch_description
                     job_post = self._process_job(job, job_id, fetch_desc)
                     if job_post:
                         job_list.append(job_post)
-                        log.info(f"Added job: {job_post.title} (ID: {job_id})")
+                        log.info("Added job: %s (ID: %s)", job_post.title, job_id)
                     if not continue_search():
                         break
                 except Exception as e:
@@ -207,7 +208,7 @@ class Naukri(Scraper):
             vacancy_count=vacancy_count,
             work_from_home_type=work_from_home_type,
         )
-        log.debug(f"Processed job: {title} at {company}")
+        log.debug("Processed job: %s at %s", title, company)
         return job_post
 
     def _get_location(self, placeholders: list[dict]) -> Location:
@@ -222,7 +223,8 @@ class Naukri(Scraper):
                 city = parts[0] if parts else None
                 state = parts[1] if len(parts) > 1 else None
                 location = Location(city=city, state=state, country=Country.INDIA)
-                log.debug(f"Parsed location: {location.display_location()}")
+                if log.isEnabledFor(logging.DEBUG):
+                    log.debug("Parsed location: %s", location.display_location())
                 break
         return location
 
@@ -252,14 +254,14 @@ class Naukri(Scraper):
                         min_salary *= 10000000  # 1 Crore = 10,000,000 INR
                         max_salary *= 10000000
 
-                    log.debug(f"Parsed salary: {min_salary} - {max_salary} INR")
+                    log.debug("Parsed salary: %s - %s INR", min_salary, max_salary)
                     return Compensation(
                         min_amount=int(min_salary),
                         max_amount=int(max_salary),
                         currency=currency,
                     )
                 else:
-                    log.debug(f"Could not parse salary: {salary_text}")
+                    log.debug("Could not parse salary: %s", salary_text)
                     return None
         return None
 
@@ -267,7 +269,6 @@ class Naukri(Scraper):
         """
         Parses date from footerPlaceholderLabel or createdDate, returning a date object
         """
-        today = datetime.now()
         if not label:
             if created_date:
                 return datetime.fromtimestamp(created_date / 1000).date()  # Convert to date
@@ -275,17 +276,17 @@ class Naukri(Scraper):
         label = label.lower()
         if "today" in label or "just now" in label or "few hours" in label:
             log.debug("Date parsed as today")
-            return today.date()
+            return date.today()
         elif "ago" in label:
             match = re.search(r"(\d+)\s*day", label)
             if match:
                 days = int(match.group(1))
-                parsed_date = (today - timedelta(days = days)).date()
-                log.debug(f"Date parsed: {days} days ago -> {parsed_date}")
+                parsed_date = date.today() - timedelta(days=days)
+                log.debug("Date parsed: %s days ago -> %s", days, parsed_date)
                 return parsed_date
         elif created_date:
             parsed_date = datetime.fromtimestamp(created_date / 1000).date()
-            log.debug(f"Date parsed from timestamp: {parsed_date}")
+            log.debug("Date parsed from timestamp: %s", parsed_date)
             return parsed_date
         log.debug("No date parsed")
         return None
@@ -295,10 +296,14 @@ class Naukri(Scraper):
         Infers work-from-home type from job data (e.g., 'Hybrid', 'Remote', 'Work from office')
         """
         location_str = next((p["label"] for p in placeholders if p["type"] == "location"), "").lower()
-        if "hybrid" in location_str or "hybrid" in title.lower() or "hybrid" in description.lower():
+        title = title.lower()
+        description = description.lower()
+        if "hybrid" in location_str or "hybrid" in title or "hybrid" in description:
             return "Hybrid"
-        elif "remote" in location_str or "remote" in title.lower() or "remote" in description.lower():
+        elif "remote" in location_str or "remote" in title or "remote" in description:
             return "Remote"
-        elif "work from office" in description.lower() or not ("remote" in description.lower() or "hybrid" in description.lower()):
+        elif "work from office" in description or not (
+            "remote" in description or "hybrid" in description
+        ):
             return "Work from office"
         return None
\ No newline at end of file
@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+import re
+
 from bs4 import BeautifulSoup
 from jobspy.model import JobType, Location
 from jobspy.util import get_enum_from_job_type
 
+remote_regex = re.compile(r"remote|work from home|wfh", re.IGNORECASE)
+
 
 def parse_job_type(soup: BeautifulSoup |str) -> list[JobType] | None:
     """
@@ -32,7 +36,6 @@ def is_job_remote(title: str, description: str, location: Location) -> bool:
     """
     Searches the title, description, and location to check if the job is remote
     """
-    remote_keywords = ["remote", "work from home", "wfh"]
     location_str = location.display_location()
-    full_string = f"{title} {description} {location_str}".lower()
-    return any(keyword in full_string for keyword in remote_keywords)
\ No newline at end of file
+    full_string = f"{title} {description} {location_str}"
+    return remote_regex.search(full_string) is not None
\ No newline at end of file
@@ -8,10 +8,11 @@ import numpy as np
 import requests
 import tls_client
 import urllib3
+from bs4 import BeautifulSoup
 from markdownify import markdownify as md
 from requests.adapters import HTTPAdapter, Retry
 
-from jobspy.model import CompensationInterval, JobType, Site
+from jobspy.model import CompensationInterval, JobType, Site, job_type_lookup
 
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
@@ -158,7 +159,6 @@ def markdown_converter(description_html: str):
     return markdown.strip()
 
 def plain_converter(decription_html:str):
-    from bs4 import BeautifulSoup
     if decription_html is None:
         return None
     soup = BeautifulSoup(decription_html, "html.parser")
@@ -167,10 +167,12 @@ def plain_converter(decription_html:str):
     return text.strip()
 
 
+email_regex = re.compile(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}")
+
+
 def extract_emails_from_text(text: str) -> list[str] | None:
     if not text:
         return None
-    email_regex = re.compile(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}")
     return email_regex.findall(text)
 
 
@@ -178,11 +180,7 @@ def get_enum_from_job_type(job_type_str: str) -> JobType | None:
     """
     Given a string, returns the corresponding JobType enum member if a match is found.
     """
-    res = None
-    for job_type in JobType:
-        if job_type_str in job_type.value:
-            res = job_type
-    return res
+    return job_type_lookup.get(job_type_str)
 
 
 def currency_parser(cur_str):
@@ -278,20 +276,21 @@ def extract_salary(
     return None, None, None, None
 
 
+job_type_keywords = {
+    JobType.FULL_TIME: re.compile(r"full\s?time", re.IGNORECASE),
+    JobType.PART_TIME: re.compile(r"part\s?time", re.IGNORECASE),
+    JobType.INTERNSHIP: re.compile(r"internship", re.IGNORECASE),
+    JobType.CONTRACT: re.compile(r"contract", re.IGNORECASE),
+}
+
+
 def extract_job_type(description: str):
     if not description:
         return []
 
-    keywords = {
-        JobType.FULL_TIME: r"full\s?time",
-        JobType.PART_TIME: r"part\s?time",
-        JobType.INTERNSHIP: r"internship",
-        JobType.CONTRACT: r"contract",
-    }
-
     listing_types = []
-    for key, pattern in keywords.items():
-        if re.search(pattern, description, re.IGNORECASE):
+    for key, pattern in job_type_keywords.items():
+        if pattern.search(description):
             listing_types.append(key)
 
     return listing_types if listing_types else None
@@ -302,9 +301,9 @@ def map_str_to_site(site_name: str) -> Site:
 
 
 def get_enum_from_value(value_str):
-    for job_type in JobType:
-        if value_str in job_type.value:
-            return job_type
+    job_type = job_type_lookup.get(value_str)
+    if job_type:
+        return job_type
     raise Exception(f"Invalid job type: {value_str}")
 
 
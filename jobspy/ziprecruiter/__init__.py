@@ -65,28 +65,33 @@ class ZipRecruiter(Scraper):
         continue_token = None
 
         max_pages = math.ceil(scraper_input.results_wanted / self.jobs_per_page)
-        for page in range(1, max_pages + 1):
-            if len(job_list) >= scraper_input.results_wanted:
-                break
-            if page > 1:
-                time.sleep(self.delay)
-            log.info(f"search page: {page} / {max_pages}")
-            jobs_on_page, continue_token = self._find_jobs_in_page(
-                scraper_input, continue_token
-            )
-            if jobs_on_page:
-                job_list.extend(jobs_on_page)
-            else:
-                break
-            if not continue_token:
-                break
+        with ThreadPoolExecutor(max_workers=self.jobs_per_page) as executor:
+            for page in range(1, max_pages + 1):
+                if len(job_list) >= scraper_input.results_wanted:
+                    break
+                if page > 1:
+                    time.sleep(self.delay)
+                log.info(f"search page: {page} / {max_pages}")
+                jobs_on_page, continue_token = self._find_jobs_in_page(
+                    executor, scraper_input, continue_token
+                )
+                if jobs_on_page:
+                    job_list.extend(jobs_on_page)
+                else:
+                    break
+                if not continue_token:
+                    break
         return JobResponse(jobs=job_list[: scraper_input.results_wanted])
 
     def _find_jobs_in_page(
-        self, scraper_input: ScraperInput, continue_token: str | None = None
+        self,
+        executor: ThreadPoolExecutor,
+        scraper_input: ScraperInput,
+        continue_token: str | None = None,
     ) -> tuple[list[JobPost], str | None]:
         """
         Scrapes a page of ZipRecruiter for jobs with scraper_input criteria
+        :param executor: thread pool the page's jobs are processed on
         :param scraper_input:
         :param continue_token:
         :return: jobs found on page
@@ -115,8 +120,7 @@ class ZipRecruiter(Scraper):
         res_data = res.json()
         jobs_list = res_data.get("jobs", [])
         next_continue_token = res_data.get("continue", None)
-        with ThreadPoolExecutor(max_workers=self.jobs_per_page) as executor:
-            job_results = [executor.submit(self._process_job, job) for job in jobs_list]
+        job_results = [executor.submit(self._process_job, job) for job in jobs_list]
 
         job_list = list(filter(None, (result.result() for result in job_results)))
         return job_list, next_continue_token
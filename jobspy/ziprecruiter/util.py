@@ -1,4 +1,6 @@
-from jobspy.model import JobType
+from jobspy.model import JobType, job_type_lookup
+
+job_type_map = {JobType.FULL_TIME: "full_time", JobType.PART_TIME: "part_time"}
 
 
 def add_params(scraper_input) -> dict[str, str | int]:
@@ -9,7 +11,6 @@ def add_params(scraper_input) -> dict[str, str | int]:
     if scraper_input.hours_old:
         params["days"] = max(scraper_input.hours_old // 24, 1)
 
-    job_type_map = {JobType.FULL_TIME: "full_time", JobType.PART_TIME: "part_time"}
     if scraper_input.job_type:
         job_type = scraper_input.job_type
         params["employment_type"] = job_type_map.get(job_type, job_type.value[0])
@@ -25,7 +26,5 @@ def add_params(scraper_input) -> dict[str, str | int]:
 
 
 def get_job_type_enum(job_type_str: str) -> list[JobType] | None:
-    for job_type in JobType:
-        if job_type_str in job_type.value:
-            return [job_type]
-    return None
+    job_type = job_type_lookup.get(job_type_str)
+    return [job_type] if job_type else None